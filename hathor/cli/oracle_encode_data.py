@@ -1,9 +1,24 @@
-import base64
 import struct
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec
 
+try:
+    # pybase64 is a drop-in replacement with SIMD accelerated encoding/decoding
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore
+
+_PACKERS = {
+    1: struct.Struct('!B').pack,
+    2: struct.Struct('!H').pack,
+    4: struct.Struct('!I').pack,
+    8: struct.Struct('!Q').pack,
+}
+
+# index is the minimum number of bytes needed, value is the width used to encode it
+_WIDTH = [1, 1, 2, 4, 4, 8, 8, 8, 8]
+
 
 def main():
     from hathor.cli.util import create_parser
@@ -15,7 +30,7 @@ def main():
     parser.add_argument('--keyfile', help='Path to a private key file, used to sign the data')
     args = parser.parse_args()
 
-    binary_data = b''
+    parts = bytearray()
 
     for d in args.data:
         [t, _data] = d.split(':')
@@ -27,28 +42,25 @@ def main():
             print('wrong data type {}'.format(d))
             return 1
 
-        binary_data += (bytes([len(b)]) + b)
+        parts.append(len(b))
+        parts.extend(b)
+
+    binary_data = bytes(parts)
 
-    print('data (base64):', base64.b64encode(binary_data).decode('utf-8'))
+    print('data (base64):', base64.b64encode(binary_data).decode('ascii'))
 
     with open(args.keyfile, 'r') as key_file:
         private_key_bytes = base64.b64decode(key_file.read())
     private_key = get_private_key_from_bytes(private_key_bytes)
     signature = private_key.sign(binary_data, ec.ECDSA(hashes.SHA256()))
-    print('signature (base64):', base64.b64encode(signature).decode('utf-8'))
+    print('signature (base64):', base64.b64encode(signature).decode('ascii'))
 
 
 def encode_int(data):
     d = int(data)
-    if d > 4294967295:
-        n = struct.pack('!Q', d)
-    elif d > 65535:
-        n = struct.pack('!I', d)
-    elif d > 255:
-        n = struct.pack('!H', d)
-    else:
-        n = struct.pack('!B', d)
-    return n
+    # number of bytes needed to represent d, rounded up to one of the supported widths
+    n = min(max(1, (d.bit_length() + 7) >> 3), 8)
+    return _PACKERS[_WIDTH[n]](d)
 
 
 def encode_str(data):
@@ -25,7 +25,6 @@ from structlog import get_logger
 from hathor.pubsub import HathorEvents
 from hathor.transaction import BaseTransaction, Transaction
 from hathor.transaction.base_transaction import TxVersion
-from hathor.transaction.scripts import parse_address_script
 
 if TYPE_CHECKING:  # pragma: no cover
     from hathor.pubsub import PubSubManager, EventArguments  # noqa: F401
@@ -380,13 +379,13 @@ class WalletIndex:
         addresses: Set[str] = set()
 
         def add_address_from_output(output: 'TxOutput') -> None:
-            script_type_out = parse_address_script(output.script)
+            script_type_out = output.get_address_script()
             if script_type_out:
                 address = script_type_out.address
                 addresses.add(address)
 
-        for txin in tx.inputs:
-            tx2 = tx.storage.get_transaction(txin.tx_id)
+        spent_txs = tx.storage.get_transactions_multi([txin.tx_id for txin in tx.inputs])
+        for txin, tx2 in zip(tx.inputs, spent_txs):
             txout = tx2.outputs[txin.index]
             add_address_from_output(txout)
 
@@ -400,6 +399,9 @@ class WalletIndex:
         """
         if not self.pubsub:
             return
+        # avoid collecting addresses and serializing the tx when no one is listening
+        if not self.pubsub.has_subscribers(HathorEvents.WALLET_ADDRESS_HISTORY):
+            return
         if addresses is None:
             addresses = self._get_addresses(tx)
         data = tx.to_json_extended()
@@ -438,12 +440,20 @@ class WalletIndex:
     def get_from_address(self, address: str) -> List[bytes]:
         """ Get list of transaction hashes of an address
         """
-        return list(self.index[address])
+        # XXX: use `get` so querying an unknown address does not add an empty set to the defaultdict
+        return list(self.index.get(address, ()))
 
     def get_sorted_from_address(self, address: str) -> List[bytes]:
         """ Get a sorted list of transaction hashes of an address
         """
-        return sorted(self.index[address])
+        return sorted(self.index.get(address, ()))
+
+    def is_address_empty(self, address: str) -> bool:
+        """ Check whether an address has no transactions
+
+        It doesn't copy the set of hashes and doesn't create an entry on the index for unknown addresses.
+        """
+        return not self.index.get(address)
 
 
 class TokensIndex:
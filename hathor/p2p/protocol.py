@@ -110,6 +110,7 @@ class HathorProtocol:
     transport: ITransport
     state: Optional[BaseState]
     connection_time: float
+    remote_address: str
     _state_instances: Dict[PeerState, BaseState]
     connection_string: Optional[str]
     expected_peer_id: Optional[str]
@@ -141,6 +142,9 @@ class HathorProtocol:
         # The time in which the connection was established.
         self.connection_time = 0.0
 
+        # The address of the other side of the connection, in the `host:port` format.
+        self.remote_address = ''
+
         # The current state of the connection.
         self.state: Optional[BaseState] = None
 
@@ -189,6 +193,7 @@ class HathorProtocol:
         self.log.info('peer connected', remote=remote)
 
         self.connection_time = time.time()
+        self.remote_address = '{}:{}'.format(remote.host, remote.port)
 
         # The initial state is HELLO.
         self.change_state(self.PeerState.HELLO)
@@ -1,12 +1,30 @@
 import json
 import time
+from typing import Any
 
-from twisted.web import resource
+from twisted.web import resource, server
 
 import hathor
 from hathor.api_util import set_cors
 from hathor.cli.openapi_files.register import register_resource
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Number of known peers serialized in each write of the response
+_KNOWN_PEERS_BATCH_SIZE = 500
+
+
+def _json_dumps(data: Any, *, pretty: bool = False) -> bytes:
+    """ Serialize data to utf-8 encoded json, compact unless `pretty` is set
+    """
+    if orjson is not None:
+        # orjson is much faster than the json module and already returns utf-8 encoded bytes
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode('utf-8')
+
 
 @register_resource
 class StatusResource(resource.Resource):
@@ -24,6 +42,14 @@ class StatusResource(resource.Resource):
         request.setHeader(b'content-type', b'application/json; charset=utf-8')
         set_cors(request, 'GET')
 
+        # Indentation is only useful for humans and roughly doubles the size of the response
+        if b'pretty' in request.args:
+            pretty = request.args[b'pretty'][0].decode('utf-8') == 'true'
+        else:
+            pretty = False
+
+        now = time.time()
+
         connecting_peers = []
         for endpoint, deferred in self.manager.connections.connecting_peers.items():
             host = getattr(endpoint, '_host', '')
@@ -32,62 +58,82 @@ class StatusResource(resource.Resource):
 
         handshaking_peers = []
         for conn in self.manager.connections.handshaking_peers:
-            remote = conn.transport.getPeer()
             handshaking_peers.append({
-                'address': '{}:{}'.format(remote.host, remote.port),
+                'address': conn.remote_address,
                 'state': conn.state.state_name,
-                'uptime': time.time() - conn.connection_time,
+                'uptime': now - conn.connection_time,
                 'app_version': conn.app_version,
             })
 
         connected_peers = []
         for conn in self.manager.connections.connected_peers.values():
-            remote = conn.transport.getPeer()
             status = {}
             for name, plugin in conn.state.plugins.items():
                 status[name] = plugin.get_status()
             connected_peers.append({
                 'id': conn.peer.id,
                 'app_version': conn.app_version,
-                'uptime': time.time() - conn.connection_time,
-                'address': '{}:{}'.format(remote.host, remote.port),
+                'uptime': now - conn.connection_time,
+                'address': conn.remote_address,
                 'state': conn.state.state_name,
                 # 'received_bytes': conn.received_bytes,
-                'last_message': time.time() - conn.last_message,
+                'last_message': now - conn.last_message,
                 'plugins': status,
                 'warning_flags': [flag.value for flag in conn.warning_flags],
             })
 
-        known_peers = []
-        for peer in self.manager.connections.peer_storage.values():
-            known_peers.append({
-                'id': peer.id,
-                'entrypoints': peer.entrypoints,
-                'flags': [flag.value for flag in peer.flags],
-            })
-
         app = 'Hathor v{}'.format(hathor.__version__)
-        data = {
-            'server': {
-                'id': self.manager.connections.my_peer.id,
-                'app_version': app,
-                'state': self.manager.state.value,
-                'network': self.manager.network,
-                'uptime': time.time() - self.manager.start_time,
-                'entrypoints': self.manager.connections.my_peer.entrypoints,
-            },
-            'known_peers': known_peers,
-            'connections': {
-                'connected_peers': connected_peers,
-                'handshaking_peers': handshaking_peers,
-                'connecting_peers': connecting_peers,
-            },
-            'dag': {
-                'first_timestamp': self.manager.tx_storage.first_timestamp,
-                'latest_timestamp': self.manager.tx_storage.latest_timestamp,
-            }
+        server_data = {
+            'id': self.manager.connections.my_peer.id,
+            'app_version': app,
+            'state': self.manager.state.value,
+            'network': self.manager.network,
+            'uptime': now - self.manager.start_time,
+            'entrypoints': self.manager.connections.my_peer.entrypoints,
         }
-        return json.dumps(data, indent=4).encode('utf-8')
+        connections = {
+            'connected_peers': connected_peers,
+            'handshaking_peers': handshaking_peers,
+            'connecting_peers': connecting_peers,
+        }
+        dag = {
+            'first_timestamp': self.manager.tx_storage.first_timestamp,
+            'latest_timestamp': self.manager.tx_storage.latest_timestamp,
+        }
+
+        known_peers = ({
+            'id': peer.id,
+            'entrypoints': peer.entrypoints,
+            'flags': [flag.value for flag in peer.flags],
+        } for peer in self.manager.connections.peer_storage.values())
+
+        if pretty:
+            data = {
+                'server': server_data,
+                'known_peers': list(known_peers),
+                'connections': connections,
+                'dag': dag,
+            }
+            return _json_dumps(data, pretty=True)
+
+        # The list of known peers may be very large, so it is serialized in batches of peers instead of building the
+        # whole response at once, this only bounds the size of the intermediate objects: the response is still
+        # written synchronously. The resulting document is the same as serializing:
+        # {'server': ..., 'known_peers': [...], 'connections': ..., 'dag': ...}
+        request.write(b'{"server": ' + _json_dumps(server_data) + b', "known_peers": [')
+        separator = b''
+        batch = []
+        for peer_data in known_peers:
+            batch.append(_json_dumps(peer_data))
+            if len(batch) == _KNOWN_PEERS_BATCH_SIZE:
+                request.write(separator + b', '.join(batch))
+                separator = b', '
+                batch = []
+        if batch:
+            request.write(separator + b', '.join(batch))
+        request.write(b'], "connections": ' + _json_dumps(connections) + b', "dag": ' + _json_dumps(dag) + b'}')
+        request.finish()
+        return server.NOT_DONE_YET
 
 
 StatusResource.openapi = {
@@ -114,6 +160,17 @@ StatusResource.openapi = {
             'operationId': 'status',
             'summary': 'Status of Hathor network',
             'description': 'Returns the server data and the details of peers',
+            'parameters': [
+                {
+                    'name': 'pretty',
+                    'in': 'query',
+                    'description': 'Whether the response should be indented',
+                    'required': False,
+                    'schema': {
+                        'type': 'boolean'
+                    }
+                }
+            ],
             'responses': {
                 '200': {
                     'description': 'Success',
@@ -135,6 +135,13 @@ class PubSubManager:
         if fn in self._subscribers[key]:
             self._subscribers[key].remove(fn)
 
+    def has_subscribers(self, key: HathorEvents) -> bool:
+        """Whether there is any function subscribed to a specific event.
+
+        It can be used to skip building the arguments of an event that nobody will receive.
+        """
+        return bool(self._subscribers.get(key))
+
     def publish(self, key: HathorEvents, **kwargs: Any) -> None:
         """Publish a new event.
 
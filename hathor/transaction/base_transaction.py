@@ -24,7 +24,7 @@ from abc import ABC, abstractclassmethod, abstractmethod
 from enum import IntEnum
 from math import inf, isfinite, log
 from struct import error as StructError, pack
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from structlog import get_logger
 
@@ -46,6 +46,7 @@ from hathor.transaction.util import int_to_bytes, unpack, unpack_len
 from hathor.util import classproperty
 
 if TYPE_CHECKING:
+    from hathor.transaction.scripts import MultiSig, P2PKH  # noqa: F401
     from hathor.transaction.storage import TransactionStorage  # noqa: F401
 
 logger = get_logger()
@@ -909,12 +910,12 @@ class TxInput:
 
         :rtype: bytes
         """
-        ret = b''
-        ret += self.tx_id
-        ret += int_to_bytes(self.index, 1)
-        ret += int_to_bytes(len(self.data), 2)  # data length
-        ret += self.data
-        return ret
+        return b''.join((
+            self.tx_id,
+            int_to_bytes(self.index, 1),
+            int_to_bytes(len(self.data), 2),  # data length
+            self.data,
+        ))
 
     def get_sighash_bytes(self, clear_data: bool) -> bytes:
         """Return a serialization of the input for the sighash
@@ -1008,6 +1009,10 @@ class TxOutput:
         self.script = script  # bytes
         self.token_data = token_data  # int
 
+        # Cache of `get_address_script()` and the script it was parsed from
+        self._address_script: Optional[Union['P2PKH', 'MultiSig']] = None
+        self._address_script_source: Optional[bytes] = None
+
     def __repr__(self) -> str:
         return str(self)
 
@@ -1020,12 +1025,12 @@ class TxOutput:
 
         :rtype: bytes
         """
-        ret = b''
-        ret += output_value_to_bytes(self.value)
-        ret += int_to_bytes(self.token_data, 1)
-        ret += int_to_bytes(len(self.script), 2)    # script length
-        ret += self.script
-        return ret
+        return b''.join((
+            output_value_to_bytes(self.value),
+            int_to_bytes(self.token_data, 1),
+            int_to_bytes(len(self.script), 2),  # script length
+            self.script,
+        ))
 
     @classmethod
     def create_from_bytes(cls, buf: bytes) -> Tuple['TxOutput', bytes]:
@@ -1054,12 +1059,24 @@ class TxOutput:
         """Whether this utxo can melt tokens"""
         return self.is_token_authority() and ((self.value & self.TOKEN_MELT_MASK) > 0)
 
+    def get_address_script(self) -> Optional[Union['P2PKH', 'MultiSig']]:
+        """Return the parsed P2PKH or MultiSig script of this output, or None if it's neither.
+
+        Parsing is cached because every index and wallet that handles this output needs it. The cache is
+        discarded if `self.script` is replaced.
+        """
+        if self._address_script_source is not self.script:
+            from hathor.transaction.scripts import parse_address_script
+            self._address_script = parse_address_script(self.script)
+            self._address_script_source = self.script
+        return self._address_script
+
     def to_human_readable(self) -> Dict[str, Any]:
         """Checks what kind of script this is and returns it in human readable form
         """
-        from hathor.transaction.scripts import parse_address_script, NanoContractMatchValues
+        from hathor.transaction.scripts import NanoContractMatchValues
 
-        script_type = parse_address_script(self.script)
+        script_type = self.get_address_script()
         if script_type:
             ret = script_type.to_human_readable()
             ret['value'] = self.value
@@ -58,6 +58,14 @@ settings = HathorSettings()
 #      for signaling that an OP was applied on a wrongly typed stack.
 Stack = List[Union[bytes, int, str]]
 
+# big-endian unsigned integers used to push and read int data, timelocks are encoded as u32int
+_STRUCT_B, _STRUCT_H, _STRUCT_I, _STRUCT_Q = (struct.Struct(fmt) for fmt in ('!B', '!H', '!I', '!Q'))
+_PACK_B, _PACK_H, _PACK_I, _PACK_Q = _STRUCT_B.pack, _STRUCT_H.pack, _STRUCT_I.pack, _STRUCT_Q.pack
+_UNPACK_I = _STRUCT_I.unpack
+
+# unpackers indexed by the size in bytes of the integer
+_UNPACK_BY_SIZE = {1: _STRUCT_B.unpack, 2: _STRUCT_H.unpack, 4: _UNPACK_I, 8: _STRUCT_Q.unpack}
+
 
 class ScriptExtras(NamedTuple):
     tx: Transaction
@@ -172,13 +180,13 @@ class HathorScript:
     def pushData(self, data: Union[int, bytes]) -> None:
         if isinstance(data, int):
             if data > 4294967295:
-                n = struct.pack('!Q', data)
+                n = _PACK_Q(data)
             elif data > 65535:
-                n = struct.pack('!I', data)
+                n = _PACK_I(data)
             elif data > 255:
-                n = struct.pack('!H', data)
+                n = _PACK_H(data)
             else:
-                n = struct.pack('!B', data)
+                n = _PACK_B(data)
             data = n
         if len(data) <= 75:
             self.data += (bytes([len(data)]) + data)
@@ -272,7 +280,7 @@ class P2PKH:
             pushdata_timelock = groups[0]
             if pushdata_timelock:
                 timelock_bytes = pushdata_timelock[1:]
-                timelock = struct.unpack('!I', timelock_bytes)[0]
+                (timelock,) = _UNPACK_I(timelock_bytes)
             pushdata_address = groups[1]
             public_key_hash = get_pushdata(pushdata_address)
             address_b58 = get_address_b58_from_public_key_hash(public_key_hash)
@@ -372,7 +380,7 @@ class MultiSig:
             pushdata_timelock = groups[0]
             if pushdata_timelock:
                 timelock_bytes = pushdata_timelock[1:]
-                timelock = struct.unpack('!I', timelock_bytes)[0]
+                (timelock,) = _UNPACK_I(timelock_bytes)
             redeem_script_hash = get_pushdata(groups[1])
             address_b58 = get_address_b58_from_redeem_script_hash(redeem_script_hash)
             return cls(address_b58, timelock)
@@ -475,7 +483,7 @@ class NanoContractMatchValues:
         s.addOpcode(Opcode.OP_DATA_STREQUAL)
         # compare second value from data with min_timestamp
         s.addOpcode(Opcode.OP_1)
-        s.pushData(struct.pack('!I', self.min_timestamp))
+        s.pushData(_PACK_I(self.min_timestamp))
         s.addOpcode(Opcode.OP_DATA_GREATERTHAN)
         # finally, compare third value with values on dict
         s.addOpcode(Opcode.OP_2)
@@ -757,18 +765,11 @@ def binary_to_int(binary: bytes) -> int:
     :param binary: value to convert
     :type binary: bytes
     """
-    if len(binary) == 1:
-        _format = '!B'
-    elif len(binary) == 2:
-        _format = '!H'
-    elif len(binary) == 4:
-        _format = '!I'
-    elif len(binary) == 8:
-        _format = '!Q'
-    else:
+    unpack_uint = _UNPACK_BY_SIZE.get(len(binary))
+    if unpack_uint is None:
         raise struct.error
 
-    (value,) = struct.unpack(_format, binary)
+    (value,) = unpack_uint(binary)
     return value
 
 
@@ -856,7 +857,7 @@ def op_greaterthan_timestamp(stack: Stack, log: List[str], extras: ScriptExtras)
         raise MissingStackItems('OP_GREATERTHAN_TIMESTAMP: empty stack')
     buf = stack.pop()
     assert isinstance(buf, bytes)
-    (timelock,) = struct.unpack('!I', buf)
+    (timelock,) = _UNPACK_I(buf)
     if extras.tx.timestamp <= timelock:
         raise TimeLocked('The output is locked until {}'.format(
             datetime.datetime.fromtimestamp(timelock).strftime("%m/%d/%Y %I:%M:%S %p")))
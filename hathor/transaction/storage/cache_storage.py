@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, Generator, Iterator, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterator, List, Optional, Set
 
 from twisted.internet import threads
 from twisted.internet.defer import Deferred, inlineCallbacks, succeed
@@ -166,6 +166,29 @@ class TransactionCacheStorage(BaseTransactionStorage):
         assert tx is not None
         return tx
 
+    def get_transactions_multi(self, hashes: List[bytes]) -> List[BaseTransaction]:
+        missing = [
+            hash_bytes for hash_bytes in dict.fromkeys(hashes)
+            if hash_bytes not in self.cache and self.get_transaction_from_weakref(hash_bytes) is None
+        ]
+        fetched: Dict[bytes, BaseTransaction] = {}
+        if missing:
+            # read everything that is not cached in a single call to the store, then handle each tx just like a
+            # miss in `_get_transaction` does
+            for tx in self.store.get_transactions_multi(missing):
+                assert tx.hash is not None
+                tx.storage = self
+                self.stats['miss'] += 1
+                self._update_cache(tx)
+                self._save_to_weakref(tx)
+                fetched[tx.hash] = tx
+        # txs that were just fetched are returned directly, so they are not counted again as hits, repeated hashes
+        # and txs that were already cached go through the regular path
+        return [
+            fetched.pop(hash_bytes) if hash_bytes in fetched else self.get_transaction(hash_bytes)
+            for hash_bytes in hashes
+        ]
+
     def get_all_transactions(self):
         self._flush_to_storage(self.dirty_txs.copy())
         for tx in self.store.get_all_transactions():
@@ -1,5 +1,5 @@
 import os
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 import rocksdb
 
@@ -18,7 +18,13 @@ class TransactionRocksDBStorage(BaseTransactionStorage, TransactionStorageAsyncF
 
     def __init__(self, path='./', with_index=True):
         tx_dir = os.path.join(path, 'tx.db')
-        self._db = rocksdb.DB(tx_dir, rocksdb.Options(create_if_missing=True))
+        # keys are tx hashes and are only queried by point lookups, a bloom filter lets `transaction_exists` and
+        # `get` of missing txs skip reading data blocks from the SST files
+        table_factory = rocksdb.BlockBasedTableFactory(
+            filter_policy=rocksdb.BloomFilterPolicy(10),
+            block_cache=rocksdb.LRUCache(64 * 1024 * 1024),
+        )
+        self._db = rocksdb.DB(tx_dir, rocksdb.Options(create_if_missing=True, table_factory=table_factory))
 
         attributes_dir = os.path.join(path, 'attributes.db')
         self.attributes_db = rocksdb.DB(attributes_dir, rocksdb.Options(create_if_missing=True))
@@ -80,13 +86,9 @@ class TransactionRocksDBStorage(BaseTransactionStorage, TransactionStorageAsyncF
         tx = self._load_from_bytes(data)
         return tx
 
-    def get_all_transactions(self) -> Iterator['BaseTransaction']:
-        tx: Optional['BaseTransaction']
-
-        items = self._db.iteritems()
-        items.seek_to_first()
-
-        def get_tx(hash_bytes, data):
+    def _get_transaction_from_data(self, hash_bytes: bytes, data: bytes) -> 'BaseTransaction':
+        """Load a transaction from data already read from the db, unless it is already in the weakref."""
+        def get_tx():
             tx = self.get_transaction_from_weakref(hash_bytes)
             if tx is None:
                 tx = self._load_from_bytes(data)
@@ -94,22 +96,44 @@ class TransactionRocksDBStorage(BaseTransactionStorage, TransactionStorageAsyncF
                 self._save_to_weakref(tx)
             return tx
 
-        for key, data in items:
-            hash_bytes = key
+        lock = self._get_lock(hash_bytes)
+        if lock:
+            with lock:
+                return get_tx()
+        else:
+            return get_tx()
 
-            lock = self._get_lock(hash_bytes)
-            if lock:
-                with lock:
-                    tx = get_tx(hash_bytes, data)
+    def get_transactions_multi(self, hashes: List[bytes]) -> List['BaseTransaction']:
+        txs: Dict[bytes, 'BaseTransaction'] = {}
+        missing: List[bytes] = []
+        for hash_bytes in dict.fromkeys(hashes):
+            tx = self.get_transaction_from_weakref(hash_bytes)
+            if tx is None:
+                missing.append(hash_bytes)
             else:
-                tx = get_tx(hash_bytes, data)
+                txs[hash_bytes] = tx
+
+        if missing:
+            for hash_bytes, data in self._db.multi_get(missing).items():
+                if data is None:
+                    raise TransactionDoesNotExist(hash_bytes.hex())
+                txs[hash_bytes] = self._get_transaction_from_data(hash_bytes, data)
 
+        return [txs[hash_bytes] for hash_bytes in hashes]
+
+    def get_all_transactions(self) -> Iterator['BaseTransaction']:
+        # full scans should not evict the hot blocks from the block cache
+        items = self._db.iteritems(fill_cache=False)
+        items.seek_to_first()
+
+        for key, data in items:
+            tx = self._get_transaction_from_data(key, data)
             assert tx is not None
             yield tx
 
     def get_count_tx_blocks(self) -> int:
         # XXX: there may be a more efficient way, see: https://stackoverflow.com/a/25775882
-        keys = self._db.iterkeys()
+        keys = self._db.iterkeys(fill_cache=False)
         keys.seek_to_first()
         keys_count = sum(1 for _ in keys)
         return keys_count
@@ -224,6 +224,16 @@ class TransactionStorage(ABC):
             tx = self._get_transaction(hash_bytes)
         return tx
 
+    def get_transactions_multi(self, hashes: List[bytes]) -> List[BaseTransaction]:
+        """Get the transactions with the given hashes, in the same order.
+
+        Storages that can read many keys at once should override this method to do it in a single call.
+
+        :param hashes: List of hashes in bytes.
+        :raises TransactionDoesNotExist: if any of the transactions does not exist
+        """
+        return [self.get_transaction(hash_bytes) for hash_bytes in hashes]
+
     def get_metadata(self, hash_bytes: bytes) -> Optional[TransactionMetadata]:
         """Returns the transaction metadata with hash `hash_bytes`.
 
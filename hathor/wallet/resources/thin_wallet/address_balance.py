@@ -9,7 +9,6 @@ from hathor.api_util import get_missing_params_msg, set_cors
 from hathor.cli.openapi_files.register import register_resource
 from hathor.conf import HathorSettings
 from hathor.crypto.util import decode_address
-from hathor.transaction.scripts import parse_address_script
 from hathor.wallet.exceptions import InvalidAddress
 
 if TYPE_CHECKING:
@@ -50,7 +49,7 @@ class AddressBalanceResource(resource.Resource):
         if output.is_token_authority():
             return False
 
-        script_type_out = parse_address_script(output.script)
+        script_type_out = output.get_address_script()
         if script_type_out:
             if script_type_out.address == requested_address:
                 return True
@@ -8,7 +8,6 @@ from hathor.api_util import get_missing_params_msg, set_cors
 from hathor.cli.openapi_files.register import register_resource
 from hathor.conf import HathorSettings
 from hathor.crypto.util import decode_address
-from hathor.transaction.scripts import parse_address_script
 from hathor.wallet.exceptions import InvalidAddress
 
 if TYPE_CHECKING:
@@ -37,18 +36,22 @@ class AddressSearchResource(resource.Resource):
             spent_output = spent_tx.outputs[tx_input.index]
 
             input_token_uid = spent_tx.get_token_uid(spent_output.get_token_index())
+            if input_token_uid != token:
+                continue
 
-            script_type_out = parse_address_script(spent_output.script)
+            script_type_out = spent_output.get_address_script()
             if script_type_out:
-                if script_type_out.address == address and input_token_uid == token:
+                if script_type_out.address == address:
                     return True
 
         for tx_output in tx.outputs:
             output_token_uid = tx.get_token_uid(tx_output.get_token_index())
+            if output_token_uid != token:
+                continue
 
-            script_type_out = parse_address_script(tx_output.script)
+            script_type_out = tx_output.get_address_script()
             if script_type_out:
-                if script_type_out.address == address and output_token_uid == token:
+                if script_type_out.address == address:
                     return True
 
         return False
@@ -48,3 +48,13 @@ class PubSubTestCase(unittest.TestCase):
         pubsub.subscribe(HathorEvents.NETWORK_NEW_TX_ACCEPTED, noop)
         pubsub.subscribe(HathorEvents.NETWORK_NEW_TX_ACCEPTED, noop)
         self.assertEqual(1, len(pubsub._subscribers[HathorEvents.NETWORK_NEW_TX_ACCEPTED]))
+
+    def test_has_subscribers(self):
+        def noop():
+            pass
+        pubsub = PubSubManager(self.clock)
+        self.assertFalse(pubsub.has_subscribers(HathorEvents.NETWORK_NEW_TX_ACCEPTED))
+        pubsub.subscribe(HathorEvents.NETWORK_NEW_TX_ACCEPTED, noop)
+        self.assertTrue(pubsub.has_subscribers(HathorEvents.NETWORK_NEW_TX_ACCEPTED))
+        pubsub.unsubscribe(HathorEvents.NETWORK_NEW_TX_ACCEPTED, noop)
+        self.assertFalse(pubsub.has_subscribers(HathorEvents.NETWORK_NEW_TX_ACCEPTED))
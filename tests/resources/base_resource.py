@@ -64,7 +64,7 @@ class TestDummyRequest(DummyRequest):
             self.addArg(k, v)
 
     def json_value(self):
-        return json.loads(self.written[0].decode('utf-8'))
+        return json.loads(b''.join(self.written).decode('utf-8'))
 
 
 class StubSite(server.Site):
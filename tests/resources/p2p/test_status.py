@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 from twisted.internet import endpoints
 from twisted.internet.defer import inlineCallbacks
 
 import hathor
+from hathor.p2p.peer_id import PeerId
 from hathor.p2p.resources import StatusResource
 from tests.resources.base_resource import StubSite, _BaseResourceTest
 from tests.utils import FakeConnection
@@ -24,6 +27,45 @@ class StatusTest(_BaseResourceTest._ResourceTest):
         self.assertEqual(server_data['network'], 'testnet')
         self.assertGreater(server_data['uptime'], 0)
 
+    @inlineCallbacks
+    def test_get_pretty(self):
+        response = yield self.web.get("status", {b'pretty': b'true'})
+        self.assertEqual(len(response.written), 1)
+        self.assertIn(b'\n', response.written[0])
+        data = response.json_value()
+        self.assertEqual(data['server']['network'], 'testnet')
+        self.assertEqual(data['known_peers'], [])
+
+    @inlineCallbacks
+    def test_get_many_known_peers(self):
+        peers = []
+        for i in range(3):
+            peer = PeerId()
+            peer.entrypoints = ['tcp://192.168.1.{}:40403'.format(i)]
+            self.manager.connections.peer_storage.add(peer)
+            peers.append(peer)
+
+        # the default batch size writes all peers at once, a batch size of 2 also writes a separator between batches
+        for batch_size in [None, 2]:
+            if batch_size is None:
+                response = yield self.web.get("status")
+            else:
+                with patch('hathor.p2p.resources.status._KNOWN_PEERS_BATCH_SIZE', batch_size):
+                    response = yield self.web.get("status")
+            data = response.json_value()
+            self.assertEqual(data['server']['network'], 'testnet')
+            self.assertEqual(data['dag']['first_timestamp'], self.manager.tx_storage.first_timestamp)
+            self.assertEqual(len(data['connections']['handshaking_peers']), 1)
+
+            known_peers = data['known_peers']
+            self.assertEqual(len(known_peers), len(peers))
+            for peer, peer_data in zip(peers, known_peers):
+                self.assertEqual(peer_data, {
+                    'id': peer.id,
+                    'entrypoints': peer.entrypoints,
+                    'flags': [],
+                })
+
     @inlineCallbacks
     def test_handshaking(self):
         response = yield self.web.get("status")
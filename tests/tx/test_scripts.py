@@ -3,7 +3,13 @@ import struct
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec
 
-from hathor.crypto.util import get_address_from_public_key, get_hash160, get_public_key_bytes_compressed
+from hathor.crypto.util import (
+    get_address_b58_from_public_key_hash,
+    get_address_from_public_key,
+    get_address_from_public_key_hash,
+    get_hash160,
+    get_public_key_bytes_compressed,
+)
 from hathor.transaction.exceptions import (
     DataIndexError,
     EqualVerifyFailed,
@@ -618,6 +624,26 @@ class BasicTransaction(unittest.TestCase):
         s.insert(0, Opcode.OP_PUSHDATA1)
         self.assertEqual(100, len(get_pushdata(s)))
 
+    def test_output_get_address_script(self):
+        import base58
+        from hathor.transaction import TxOutput
+        # the script only keeps the public key hash, which is re-encoded with the network's version byte
+        pubkey_hash1 = base58.b58decode('15d14K5jMqsN2uwUEFqiPG5SoD7Vr1BfnH')[1:-4]
+        pubkey_hash2 = base58.b58decode('1K35zJQeYrVzQAW7X3s7vbPKmngj5JXTBc')[1:-4]
+
+        output = TxOutput(1, P2PKH.create_output_script(get_address_from_public_key_hash(pubkey_hash1)))
+        script_type = output.get_address_script()
+        self.assertEqual(script_type.address, get_address_b58_from_public_key_hash(pubkey_hash1))
+        # the parsed script is cached
+        self.assertIs(output.get_address_script(), script_type)
+
+        # replacing the script discards the cache
+        output.script = P2PKH.create_output_script(get_address_from_public_key_hash(pubkey_hash2))
+        self.assertEqual(output.get_address_script().address, get_address_b58_from_public_key_hash(pubkey_hash2))
+
+        output.script = b'nano_contract_code'
+        self.assertIsNone(output.get_address_script())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -258,6 +258,29 @@ class _BaseTransactionStorageTest:
             with self.assertRaises(TransactionDoesNotExist):
                 self.tx_storage.get_transaction(hex_error)
 
+        def test_get_transactions_multi(self):
+            self.tx_storage.save_transaction(self.block)
+            self.tx_storage.save_transaction(self.tx)
+            hashes = [self.tx.hash, self.genesis_txs[0].hash, self.block.hash, self.tx.hash]
+            txs = self.tx_storage.get_transactions_multi(hashes)
+            self.assertEqual([tx.hash for tx in txs], hashes)
+            self.assertEqual(txs[0], self.tx)
+            self.assertEqual(txs[2], self.block)
+
+            if isinstance(self.tx_storage, TransactionCacheStorage):
+                # empty the cache, so each distinct hash is a single miss and the repeated one is a hit
+                self.tx_storage._flush_to_storage(self.tx_storage.dirty_txs.copy())
+                self.tx_storage.cache.clear()
+                hit, miss = self.tx_storage.stats['hit'], self.tx_storage.stats['miss']
+                txs = self.tx_storage.get_transactions_multi(hashes)
+                self.assertEqual([tx.hash for tx in txs], hashes)
+                self.assertEqual(self.tx_storage.stats['miss'], miss + 3)
+                self.assertEqual(self.tx_storage.stats['hit'], hit + 1)
+
+            hex_error = bytes.fromhex('00001c5c0b69d13b05534c94a69b2c8272294e6b0c536660a3ac264820677024')
+            with self.assertRaises(TransactionDoesNotExist):
+                self.tx_storage.get_transactions_multi([self.tx.hash, hex_error])
+
         def test_save_metadata(self):
             # Saving genesis metadata
             self.tx_storage.save_transaction(self.genesis_txs[0], only_metadata=True)
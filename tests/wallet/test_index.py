@@ -43,6 +43,12 @@ class TwinTransactionTestCase(unittest.TestCase):
         wallet_data = self.manager.tx_storage.wallet_index.get_from_address(address)
         self.assertEqual(len(wallet_data), 1)
         self.assertEqual(wallet_data, [tx1.hash])
+        self.assertFalse(self.manager.tx_storage.wallet_index.is_address_empty(address))
+        self.assertTrue(self.manager.tx_storage.wallet_index.is_address_empty(self.get_address(1)))
+        unknown_address = self.get_address(2)
+        self.assertEqual(self.manager.tx_storage.wallet_index.get_from_address(unknown_address), [])
+        self.assertEqual(self.manager.tx_storage.wallet_index.get_sorted_from_address(unknown_address), [])
+        self.assertNotIn(unknown_address, self.manager.tx_storage.wallet_index.index)
 
         # Propagate a conflicting twin transaction
         self.manager.propagate_tx(tx2)